@@ -1,3 +1,5 @@
+import functools
+
 import jax
 import numpy as np
 
@@ -318,6 +320,17 @@ AFFINE_TRANSFORM_FILL_MODES = {
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _get_affine_grid(shape):
+    # The index grid only depends on the image geometry, which is fixed
+    # across batches in augmentation pipelines, so it is cached. The
+    # cached array is never mutated (`np.tile` below copies it).
+    meshgrid = np.meshgrid(*[np.arange(size) for size in shape], indexing="ij")
+    return np.concatenate(
+        [np.expand_dims(x, axis=-1) for x in meshgrid], axis=-1
+    )
+
+
 def affine_transform(
     images,
     transform,
@@ -373,12 +386,7 @@ def affine_transform(
     batch_size = images.shape[0]
 
     # get indices
-    meshgrid = np.meshgrid(
-        *[np.arange(size) for size in images.shape[1:]], indexing="ij"
-    )
-    indices = np.concatenate(
-        [np.expand_dims(x, axis=-1) for x in meshgrid], axis=-1
-    )
+    indices = _get_affine_grid(tuple(images.shape[1:]))
     indices = np.tile(indices, (batch_size, 1, 1, 1, 1))
 
     # swap the values
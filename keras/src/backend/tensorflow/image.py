@@ -1,5 +1,4 @@
 import functools
-import itertools
 import operator
 
 import tensorflow as tf
@@ -396,12 +395,14 @@ _INDEX_FIXERS = {
 
 
 def _nearest_indices_and_weights(coordinate):
+    # Indices and weights are returned stacked along a leading taps axis
+    # so that callers can process all taps of an axis with single ops.
     coordinate = (
         coordinate if coordinate.dtype.is_integer else tf.round(coordinate)
     )
-    index = tf.cast(coordinate, tf.int32)
-    weight = tf.constant(1, coordinate.dtype)
-    return [(index, weight)]
+    indices = tf.expand_dims(tf.cast(coordinate, tf.int32), axis=0)
+    weights = tf.ones((1,), dtype=coordinate.dtype)
+    return indices, weights
 
 
 def _linear_indices_and_weights(coordinate):
@@ -409,7 +410,9 @@ def _linear_indices_and_weights(coordinate):
     upper_weight = coordinate - lower
     lower_weight = 1 - upper_weight
     index = tf.cast(lower, tf.int32)
-    return [(index, lower_weight), (index + 1, upper_weight)]
+    indices = tf.stack([index, index + 1], axis=0)
+    weights = tf.stack([lower_weight, upper_weight], axis=0)
+    return indices, weights
 
 
 def map_coordinates(
@@ -444,10 +447,14 @@ def map_coordinates(
         )
 
     def is_valid(index, size):
-        if fill_mode == "constant":
-            return (0 <= index) & (index < size)
-        else:
-            return True
+        # Negative indices wrap around to values >= 2**31 when viewed
+        # as unsigned, so a single unsigned compare checks both bounds.
+        return tf.cast(index, tf.uint32) < tf.cast(size, tf.uint32)
+
+    # Only the "constant" fill mode needs validity masks; for the other
+    # modes the fixed indices are always in bounds, so the boolean
+    # broadcasts would be built (and reduced) for nothing.
+    check_validity = fill_mode == "constant"
 
     if order == 0:
         interp_fun = _nearest_indices_and_weights
@@ -456,38 +463,62 @@ def map_coordinates(
     else:
         raise NotImplementedError("map_coordinates currently requires order<=1")
 
-    valid_1d_interpolations = []
-    for coordinate, size in zip(coordinate_arrs, input_arr.shape):
-        interp_nodes = interp_fun(coordinate)
-        valid_interp = []
-        for index, weight in interp_nodes:
-            fixed_index = index_fixer(index, size)
-            valid = is_valid(index, size)
-            valid_interp.append((fixed_index, valid, weight))
-        valid_1d_interpolations.append(valid_interp)
-
-    outputs = []
-    for items in itertools.product(*valid_1d_interpolations):
-        indices, validities, weights = zip(*items)
-        indices = tf.transpose(tf.stack(indices))
-
-        def fast_path():
-            return tf.transpose(tf.gather_nd(input_arr, indices))
-
-        def slow_path():
-            all_valid = functools.reduce(operator.and_, validities)
-            return tf.where(
-                all_valid,
-                tf.transpose(tf.gather_nd(input_arr, indices)),
-                fill_value,
-            )
+    # The interpolation helpers return tap-stacked tensors, so index
+    # fixing and validity checks run once per axis instead of once per
+    # tap. The taps are then placed on dedicated leading axes so that
+    # broadcasting enumerates all corner combinations, and the
+    # contributions for every corner are fetched with a single
+    # `gather_nd` that streams the source tensor once, instead of one
+    # gather (and one multiply) per corner.
+    dim = len(input_arr.shape)
+    axis_indices = []
+    axis_validities = []
+    axis_weights = []
+    for axis, (coordinate, size) in enumerate(
+        zip(coordinate_arrs, input_arr.shape)
+    ):
+        indices, weights = interp_fun(coordinate)
+        stacked = [index_fixer(indices, size), weights]
+        if check_validity:
+            stacked.append(is_valid(indices, size))
+        for _ in range(dim - 1 - axis):
+            stacked = [tf.expand_dims(x, axis=1) for x in stacked]
+        for _ in range(axis):
+            stacked = [tf.expand_dims(x, axis=0) for x in stacked]
+        axis_indices.append(stacked[0])
+        axis_weights.append(stacked[1])
+        if check_validity:
+            axis_validities.append(stacked[2])
+
+    gather_shape = functools.reduce(
+        tf.broadcast_dynamic_shape, [tf.shape(x) for x in axis_indices]
+    )
+    corner_indices = tf.stack(
+        [tf.broadcast_to(x, gather_shape) for x in axis_indices], axis=-1
+    )
 
-        contribution = tf.cond(tf.reduce_all(validities), fast_path, slow_path)
-        outputs.append(
-            functools.reduce(operator.mul, weights)
-            * tf.cast(contribution, weights[0].dtype)
+    def fast_path():
+        return tf.gather_nd(input_arr, corner_indices)
+
+    def slow_path():
+        all_valid = functools.reduce(operator.and_, axis_validities)
+        return tf.where(
+            all_valid, tf.gather_nd(input_arr, corner_indices), fill_value
+        )
+
+    if check_validity:
+        contribution = tf.cond(
+            tf.reduce_all([tf.reduce_all(valid) for valid in axis_validities]),
+            fast_path,
+            slow_path,
         )
-    result = functools.reduce(operator.add, outputs)
+    else:
+        contribution = fast_path()
+    corner_weights = functools.reduce(operator.mul, axis_weights)
+    result = tf.reduce_sum(
+        corner_weights * tf.cast(contribution, corner_weights.dtype),
+        axis=list(range(dim)),
+    )
     if input_arr.dtype.is_integer:
         result = result if result.dtype.is_integer else tf.round(result)
     return tf.cast(result, input_arr.dtype)
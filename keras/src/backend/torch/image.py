@@ -285,6 +285,71 @@ AFFINE_TRANSFORM_FILL_MODES = {
 }
 
 
+@functools.lru_cache(maxsize=32)
+def _get_affine_grid(shape, dtype, device):
+    # Augmentation pipelines call `affine_transform` with the same image
+    # geometry on every batch, so the index grid is cached. The cached
+    # tensor is never mutated (`torch.tile` below copies it).
+    meshgrid = torch.meshgrid(
+        *[torch.arange(size, dtype=dtype, device=device) for size in shape],
+        indexing="ij",
+    )
+    return torch.concatenate(
+        [torch.unsqueeze(x, dim=-1) for x in meshgrid], dim=-1
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _get_homogeneous_grid(height, width, dtype, device):
+    # Homogeneous (y, x, 1) output grid flattened to (3, H * W), so the
+    # source coordinates of the non-projective path reduce to a single
+    # batched matmul. Cached like `_get_affine_grid`; it is only read.
+    y, x = torch.meshgrid(
+        torch.arange(height, dtype=dtype, device=device),
+        torch.arange(width, dtype=dtype, device=device),
+        indexing="ij",
+    )
+    ones = torch.ones(height * width, dtype=dtype, device=device)
+    return torch.stack([y.reshape(-1), x.reshape(-1), ones])
+
+
+def _grid_sample_affine(images, a0, a1, a2, b0, b1, b2, channels_first):
+    # Express the whole warp as affine_grid + grid_sample, which torch
+    # runs as fused kernels, instead of building coordinate planes and
+    # gathering four corners per pixel through map_coordinates. With
+    # `align_corners=True` grid_sample samples at pixel coordinate
+    # (norm + 1) * (size - 1) / 2, so the pixel-space transform is
+    # rewritten in normalized coordinates below, and the "zeros"
+    # padding mode computes exactly the constant-fill corner blend.
+    if channels_first:
+        nchw = images
+    else:
+        nchw = images.permute((0, 3, 1, 2))
+    height, width = nchw.shape[2], nchw.shape[3]
+    hw = (height - 1) / (width - 1)
+    wh = (width - 1) / (height - 1)
+    row_x = torch.stack(
+        [a0, a1 * hw, a0 + a1 * hw + 2 * a2 / (width - 1) - 1], dim=-1
+    )
+    row_y = torch.stack(
+        [b0 * wh, b1, b0 * wh + b1 + 2 * b2 / (height - 1) - 1], dim=-1
+    )
+    theta = torch.stack([row_x, row_y], dim=-2).to(nchw.dtype)
+    grid = torch.nn.functional.affine_grid(
+        theta, list(nchw.shape), align_corners=True
+    )
+    affined = torch.nn.functional.grid_sample(
+        nchw,
+        grid,
+        mode="bilinear",
+        padding_mode="zeros",
+        align_corners=True,
+    )
+    if not channels_first:
+        affined = affined.permute((0, 2, 3, 1))
+    return affined
+
+
 def affine_transform(
     images,
     transform,
@@ -330,47 +395,115 @@ def affine_transform(
     if transform.ndim == 1:
         transform = transform.unsqueeze(dim=0)
 
-    if data_format == "channels_first":
-        images = images.permute((0, 2, 3, 1))
-
     batch_size = images.shape[0]
+    channels_first = data_format == "channels_first"
+
+    # Unpack the transform with direct indexing instead of swapping
+    # values in place and round-tripping through pad/reshape. This
+    # issues far fewer small tensor ops and leaves the caller's
+    # transform untouched.
+    a0, a1, a2 = transform[:, 0], transform[:, 1], transform[:, 2]
+    b0, b1, b2 = transform[:, 3], transform[:, 4], transform[:, 5]
+    c0, c1 = transform[:, 6], transform[:, 7]
+
+    # The projective terms c0 and c1 are almost always zero (every
+    # plain affine transform, which is all augmentation generates). In
+    # that case the channel coordinate is the identity and the y/x
+    # source coordinates depend only on the (h, w) position, so the two
+    # coordinate planes are computed directly and broadcast over the
+    # channel axis instead of running the full-rank einsum. Since
+    # map_coordinates is layout agnostic, the fast path also builds the
+    # coordinates directly in the input layout, sparing channels_first
+    # images the NCHW <-> NHWC transpose pair. The einsum path is
+    # written for channels_last and keeps the transposes.
+    projective = bool(torch.any(transform[:, 6:8] != 0))
+    if channels_first:
+        height, width = images.shape[2], images.shape[3]
+    else:
+        height, width = images.shape[1], images.shape[2]
+    # The bilinear warp with zero constant fill -- the bulk of
+    # augmentation traffic -- maps exactly onto grid_sample, which runs
+    # the coordinate math, gather and blend as fused kernels. Half
+    # precision is excluded because the sampling grid would then also
+    # be half precision, which cannot address large images exactly.
+    if (
+        not projective
+        and interpolation == "bilinear"
+        and fill_mode == "constant"
+        and isinstance(fill_value, (int, float))
+        and fill_value == 0
+        and images.dtype in (torch.float32, torch.float64)
+        and height > 1
+        and width > 1
+    ):
+        affined = _grid_sample_affine(
+            images, a0, a1, a2, b0, b1, b2, channels_first
+        )
+        if need_squeeze:
+            affined = affined.squeeze(dim=0)
+        return affined
 
-    # get indices
-    meshgrid = torch.meshgrid(
-        *[
-            torch.arange(size, dtype=transform.dtype, device=transform.device)
-            for size in images.shape[1:]
-        ],
-        indexing="ij",
-    )
-    indices = torch.concatenate(
-        [torch.unsqueeze(x, dim=-1) for x in meshgrid], dim=-1
-    )
-    indices = torch.tile(indices, (batch_size, 1, 1, 1, 1))
-
-    # swap the values
-    a0 = transform[:, 0].clone()
-    a2 = transform[:, 2].clone()
-    b1 = transform[:, 4].clone()
-    b2 = transform[:, 5].clone()
-    transform[:, 0] = b1
-    transform[:, 2] = b2
-    transform[:, 4] = a0
-    transform[:, 5] = a2
-
-    # deal with transform
-    transform = torch.nn.functional.pad(
-        transform, pad=[0, 1, 0, 0], mode="constant", value=1
-    )
-    transform = torch.reshape(transform, (batch_size, 3, 3))
-    offset = transform[:, 0:2, 2].clone()
-    offset = torch.nn.functional.pad(offset, pad=[0, 1, 0, 0])
-    transform[:, 0:2, 2] = 0
+    if projective and channels_first:
+        images = images.permute((0, 2, 3, 1))
+    if projective:
+        indices = _get_affine_grid(
+            tuple(images.shape[1:]), transform.dtype, transform.device
+        )
+        indices = torch.tile(indices, (batch_size, 1, 1, 1, 1))
+        zeros = torch.zeros_like(a0)
+        ones = torch.ones_like(a0)
+        matrix = torch.stack(
+            [
+                torch.stack([b1, a1, zeros], dim=-1),
+                torch.stack([b0, a0, zeros], dim=-1),
+                torch.stack([c0, c1, ones], dim=-1),
+            ],
+            dim=-2,
+        )
+        offset = torch.stack([b2, a2, zeros], dim=-1)
 
-    # transform the indices
-    coordinates = torch.einsum("Bhwij, Bjk -> Bhwik", indices, transform)
-    coordinates = torch.moveaxis(coordinates, source=-1, destination=1)
-    coordinates += torch.reshape(a=offset, shape=(*offset.shape, 1, 1, 1))
+        # transform the indices
+        coordinates = torch.einsum("Bhwij, Bjk -> Bhwik", indices, matrix)
+        coordinates = torch.moveaxis(coordinates, source=-1, destination=1)
+        coordinates += torch.reshape(a=offset, shape=(*offset.shape, 1, 1, 1))
+    else:
+        if channels_first:
+            channels = images.shape[1]
+            shape = (batch_size, channels, height, width)
+        else:
+            channels = images.shape[3]
+            shape = (batch_size, height, width, channels)
+        # One batched matmul against the cached homogeneous grid
+        # computes both source-coordinate planes at once, replacing the
+        # six broadcasted mul-add kernels of the elementwise form.
+        grid = _get_homogeneous_grid(
+            height, width, transform.dtype, transform.device
+        )
+        rows = torch.stack(
+            [
+                torch.stack([b1, b0, b2], dim=-1),
+                torch.stack([a1, a0, a2], dim=-1),
+            ],
+            dim=-2,
+        )
+        src = torch.matmul(rows, grid).reshape(-1, 2, height, width)
+        y_src, x_src = src[:, 0], src[:, 1]
+        c_target = torch.arange(
+            channels, dtype=transform.dtype, device=transform.device
+        )
+        if channels_first:
+            planes = [
+                c_target.reshape(1, channels, 1, 1).expand(shape),
+                y_src.unsqueeze(1).expand(shape),
+                x_src.unsqueeze(1).expand(shape),
+            ]
+        else:
+            planes = [
+                y_src.unsqueeze(-1).expand(shape),
+                x_src.unsqueeze(-1).expand(shape),
+                c_target.reshape(1, 1, 1, channels).expand(shape),
+            ]
+        coordinates = torch.stack(planes, dim=1)
 
     # Note: torch.stack is faster than torch.vmap when the batch size is small.
     affined = torch.stack(
@@ -386,76 +519,179 @@ def affine_transform(
         ],
     )
 
-    if data_format == "channels_first":
+    if projective and channels_first:
         affined = affined.permute((0, 3, 1, 2))
     if need_squeeze:
         affined = affined.squeeze(dim=0)
     return affined
 
 
-def _mirror_index_fixer(index, size):
+def _make_clip_fixer(size):
+    upper = size - 1
+    return lambda index: torch.clip(index, 0, upper)
+
+
+def _make_wrap_fixer(size):
+    return lambda index: index % size
+
+
+def _make_mirror_fixer(size):
     s = size - 1  # Half-wavelength of triangular wave
+    if isinstance(size, int) and s > 0 and s & (s - 1) == 0:
+        # For power-of-two half-wavelengths (i.e. power-of-two-plus-one
+        # sizes) the signed modulo reduces to a bitwise AND and the
+        # triangular wave can be evaluated without the abs: fold the
+        # index into one period, then reflect the upper half back down.
+        mask = 2 * s - 1
+        period = 2 * s
+
+        def fixer(index):
+            folded = index & mask
+            return torch.minimum(folded, period - folded)
+
+        return fixer
+    two_s = 2 * s
     # Scaled, integer-valued version of the triangular wave |x - round(x)|
-    return torch.abs((index + s) % (2 * s) - s)
+    return lambda index: torch.abs((index + s) % two_s - s)
 
 
-def _reflect_index_fixer(index, size):
-    return torch.floor_divide(
-        _mirror_index_fixer(2 * index + 1, 2 * size + 1) - 1, 2
-    )
+def _make_reflect_fixer(size):
+    mirror = _make_mirror_fixer(2 * size + 1)
+    return lambda index: torch.floor_divide(mirror(2 * index + 1) - 1, 2)
 
 
-_INDEX_FIXERS = {
+_INDEX_FIXER_FACTORIES = {
     # we need to take care of out-of-bound indices in torch
-    "constant": lambda index, size: torch.clip(index, 0, size - 1),
-    "nearest": lambda index, size: torch.clip(index, 0, size - 1),
-    "wrap": lambda index, size: index % size,
-    "mirror": _mirror_index_fixer,
-    "reflect": _reflect_index_fixer,
+    "constant": _make_clip_fixer,
+    "nearest": _make_clip_fixer,
+    "wrap": _make_wrap_fixer,
+    "mirror": _make_mirror_fixer,
+    "reflect": _make_reflect_fixer,
 }
 
 
+@functools.lru_cache(maxsize=128)
+def _get_index_fixer(fill_mode, size):
+    # Specializing the fixer per (fill_mode, size) hoists the derived
+    # constants (clip bound, wavelength, power-of-two detection) out of
+    # the per-tap path; the same few image sizes recur for the lifetime
+    # of a pipeline, so the closures are cached.
+    return _INDEX_FIXER_FACTORIES[fill_mode](size)
+
+
 def _is_integer(a):
     if not torch.is_floating_point(a) and not torch.is_complex(a):
         return True
     return False
 
 
-def _nearest_indices_and_weights(coordinate):
-    coordinate = (
-        coordinate if _is_integer(coordinate) else torch.round(coordinate)
+def _index_dtype(size):
+    # torch advanced indexing only accepts int32/int64 index tensors
+    # (narrower types such as int16 would halve the index bandwidth but
+    # are rejected), so use int32 whenever the flattened input fits and
+    # only fall back to int64 for inputs where the linear-index
+    # arithmetic would overflow 32 bits.
+    return torch.int32 if size < 2**31 else torch.int64
+
+
+@functools.lru_cache(maxsize=None)
+def _corner_combinations(taps_per_axis):
+    # The corner enumeration only depends on the number of taps per
+    # axis (2 per axis for order 1), so compute it once per structure
+    # instead of rebuilding the product on every call.
+    return list(itertools.product(*(range(taps) for taps in taps_per_axis)))
+
+
+def _flat_gather(input_arr, indices):
+    # Fold the per-axis indices into a single linear index so the
+    # lookup is one contiguous flat gather instead of a generic N-d
+    # gather over several broadcast index tensors.
+    flat_index = indices[0]
+    for index, size in zip(indices[1:], input_arr.shape[1:]):
+        flat_index = flat_index * size + index
+    return input_arr.reshape(-1)[flat_index]
+
+
+def _corner_contribution(input_arr, indices, validities, fill_value):
+    if all(valid is True for valid in validities):
+        # fast path
+        return _flat_gather(input_arr, indices)
+    all_valid = functools.reduce(operator.and_, validities)
+    return torch.where(all_valid, _flat_gather(input_arr, indices), fill_value)
+
+
+def _bilinear_2d(input_arr, y_taps, x_taps, fill_value):
+    # Hand-unrolled four-corner expression for order-1 interpolation on
+    # rank-2 inputs. Keeps the whole interpolation in a single
+    # expression instead of driving it through the generic product loop.
+    (y0, y0_valid, wy0), (y1, y1_valid, wy1) = y_taps
+    (x0, x0_valid, wx0), (x1, x1_valid, wx1) = x_taps
+    c00 = _corner_contribution(
+        input_arr, (y0, x0), (y0_valid, x0_valid), fill_value
     )
-    index = coordinate.to(torch.int32)
-    return [(index, 1)]
-
-
-def _linear_indices_and_weights(coordinate):
-    lower = torch.floor(coordinate)
-    upper_weight = coordinate - lower
-    lower_weight = 1 - upper_weight
-    index = lower.to(torch.int32)
-    return [(index, lower_weight), (index + 1, upper_weight)]
+    c01 = _corner_contribution(
+        input_arr, (y0, x1), (y0_valid, x1_valid), fill_value
+    )
+    c10 = _corner_contribution(
+        input_arr, (y1, x0), (y1_valid, x0_valid), fill_value
+    )
+    c11 = _corner_contribution(
+        input_arr, (y1, x1), (y1_valid, x1_valid), fill_value
+    )
+    return wy0 * wx0 * c00 + wy0 * wx1 * c01 + wy1 * wx0 * c10 + wy1 * wx1 * c11
+
+
+def _bilinear_3d(input_arr, y_taps, x_taps, z_taps, fill_value):
+    # Same as `_bilinear_2d` for rank-3 inputs (e.g. an H, W, C image).
+    (y0, y0_valid, wy0), (y1, y1_valid, wy1) = y_taps
+    (x0, x0_valid, wx0), (x1, x1_valid, wx1) = x_taps
+    (z0, z0_valid, wz0), (z1, z1_valid, wz1) = z_taps
+    result = 0
+    for yi, y_valid, wy in ((y0, y0_valid, wy0), (y1, y1_valid, wy1)):
+        for xi, x_valid, wx in ((x0, x0_valid, wx0), (x1, x1_valid, wx1)):
+            c0 = _corner_contribution(
+                input_arr,
+                (yi, xi, z0),
+                (y_valid, x_valid, z0_valid),
+                fill_value,
+            )
+            c1 = _corner_contribution(
+                input_arr,
+                (yi, xi, z1),
+                (y_valid, x_valid, z1_valid),
+                fill_value,
+            )
+            result = result + wy * (wx * (wz0 * c0 + wz1 * c1))
+    return result
 
 
 def map_coordinates(
     inputs, coordinates, order, fill_mode="constant", fill_value=0.0
 ):
-    input_arr = convert_to_tensor(inputs)
-    coordinate_arrs = [convert_to_tensor(c) for c in coordinates]
+    # The corner gathers index a flat view of the input, so make it
+    # contiguous once here rather than paying a copy per corner.
+    input_arr = convert_to_tensor(inputs).contiguous()
+    # Coordinates are kept stacked as a single (dim, ...) tensor so the
+    # per-axis index and weight math further down runs once over all
+    # axes instead of once per axis.
+    if isinstance(coordinates, (list, tuple)):
+        coordinate_arrs = torch.stack(
+            [convert_to_tensor(c) for c in coordinates]
+        )
+    else:
+        coordinate_arrs = convert_to_tensor(coordinates)
 
-    if len(coordinate_arrs) != len(input_arr.shape):
+    if coordinate_arrs.shape[0] != len(input_arr.shape):
         raise ValueError(
             "First dim of `coordinates` must be the same as the rank of "
             "`inputs`. "
             f"Received inputs with shape: {input_arr.shape} and coordinate "
-            f"leading dim of {len(coordinate_arrs)}"
+            f"leading dim of {coordinate_arrs.shape[0]}"
         )
-    if len(coordinate_arrs[0].shape) < 1:
-        dim = len(coordinate_arrs)
-        shape = (dim,) + coordinate_arrs[0].shape
+    if coordinate_arrs.ndim < 2:
         raise ValueError(
             "Invalid coordinates rank: expected at least rank 2."
-            f" Received input with shape: {shape}"
+            f" Received input with shape: {tuple(coordinate_arrs.shape)}"
         )
 
     # skip tensor creation as possible
@@ -468,20 +704,13 @@ def map_coordinates(
             f"{len(coordinates)} != {len(input_arr.shape)}"
         )
 
-    index_fixer = _INDEX_FIXERS.get(fill_mode)
-    if index_fixer is None:
+    if fill_mode not in _INDEX_FIXER_FACTORIES:
         raise ValueError(
             "Invalid value for argument `fill_mode`. Expected one of "
-            f"{set(_INDEX_FIXERS.keys())}. Received: fill_mode={fill_mode}"
+            f"{set(_INDEX_FIXER_FACTORIES.keys())}. "
+            f"Received: fill_mode={fill_mode}"
         )
 
-    if order == 0:
-        interp_fun = _nearest_indices_and_weights
-    elif order == 1:
-        interp_fun = _linear_indices_and_weights
-    else:
-        raise NotImplementedError("map_coordinates currently requires order<=1")
-
     if fill_mode == "constant":
 
         def is_valid(index, size):
@@ -492,29 +721,93 @@ def map_coordinates(
         def is_valid(index, size):
             return True
 
+    index_dtype = _index_dtype(input_arr.numel())
+    # For half-precision inputs, compute the interpolation weights in
+    # the input dtype so the corner blend runs at the source precision
+    # instead of upcasting every contribution to the coordinate dtype.
+    weight_dtype = (
+        input_arr.dtype
+        if input_arr.dtype in (torch.float16, torch.bfloat16)
+        else None
+    )
+
+    # The round/floor/fractional-weight math runs once over the stacked
+    # coordinates; the per-axis taps below are views into the results.
+    if order == 0:
+        rounded = (
+            coordinate_arrs
+            if _is_integer(coordinate_arrs)
+            else torch.round(coordinate_arrs)
+        )
+        stacked_indices = rounded.to(index_dtype)
+        axis_taps = [
+            [(stacked_indices[axis], 1)]
+            for axis in range(stacked_indices.shape[0])
+        ]
+    elif order == 1:
+        lower = torch.floor(coordinate_arrs)
+        upper_weight = coordinate_arrs - lower
+        if weight_dtype is not None and weight_dtype != upper_weight.dtype:
+            upper_weight = upper_weight.to(weight_dtype)
+        lower_weight = 1 - upper_weight
+        stacked_indices = lower.to(index_dtype)
+        axis_taps = [
+            [
+                (stacked_indices[axis], lower_weight[axis]),
+                (stacked_indices[axis] + 1, upper_weight[axis]),
+            ]
+            for axis in range(stacked_indices.shape[0])
+        ]
+    else:
+        raise NotImplementedError("map_coordinates currently requires order<=1")
+
     valid_1d_interpolations = []
-    for coordinate, size in zip(coordinate_arrs, input_arr.shape):
-        interp_nodes = interp_fun(coordinate)
+    for taps, size in zip(axis_taps, input_arr.shape):
+        index_fixer = _get_index_fixer(fill_mode, size)
         valid_interp = []
-        for index, weight in interp_nodes:
-            fixed_index = index_fixer(index, size)
+        for index, weight in taps:
+            fixed_index = index_fixer(index)
             valid = is_valid(index, size)
             valid_interp.append((fixed_index, valid, weight))
         valid_1d_interpolations.append(valid_interp)
 
-    outputs = []
-    for items in itertools.product(*valid_1d_interpolations):
-        indices, validities, weights = zip(*items)
-        if all(valid is True for valid in validities):
-            # fast path
-            contribution = input_arr[indices]
-        else:
-            all_valid = functools.reduce(operator.and_, validities)
-            contribution = torch.where(
-                all_valid, input_arr[indices], fill_value
+    if order == 1 and len(valid_1d_interpolations) == 2:
+        result = _bilinear_2d(input_arr, *valid_1d_interpolations, fill_value)
+    elif order == 1 and len(valid_1d_interpolations) == 3:
+        result = _bilinear_3d(input_arr, *valid_1d_interpolations, fill_value)
+    else:
+        taps_per_axis = tuple(len(taps) for taps in valid_1d_interpolations)
+        outputs = []
+        for combination in _corner_combinations(taps_per_axis):
+            items = [
+                valid_1d_interpolations[axis][tap]
+                for axis, tap in enumerate(combination)
+            ]
+            indices, validities, weights = zip(*items)
+            contribution = _corner_contribution(
+                input_arr, indices, validities, fill_value
             )
-        outputs.append(functools.reduce(operator.mul, weights) * contribution)
-    result = functools.reduce(operator.add, outputs)
+            if order == 0:
+                # Nearest neighbor: every weight is the literal 1, so
+                # both the Python reduce and the `1 * x` tensor
+                # multiply it feeds are no-ops. Append the contribution
+                # as is.
+                outputs.append(contribution)
+            else:
+                outputs.append(
+                    functools.reduce(operator.mul, weights) * contribution
+                )
+        if len(outputs) == 1:
+            result = outputs[0]
+        else:
+            # A single stacked reduction instead of a left-leaning chain
+            # of 2**dim - 1 binary adds, each of which materialized a
+            # full intermediate tensor.
+            result = torch.stack(outputs).sum(dim=0)
     if _is_integer(input_arr):
-        result = result if _is_integer(result) else torch.round(result)
+        # `to` truncates, so float results still need to be rounded
+        # first. torch has no rounding cast, but `result` is an
+        # intermediate owned by this function, so rounding in place at
+        # least avoids materializing a second full-size float tensor.
+        result = result if _is_integer(result) else result.round_()
     return result.to(input_arr.dtype)